@@ -1,26 +1,159 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import sys
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Dict, Iterable, List
+from stat import S_ISREG
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+from xml.etree.ElementTree import XMLParser
+from xml.parsers.expat import ParserCreate
+
+try:  # CPython swaps in the C accelerator transparently; confirm it did.
+    import _elementtree
+
+    _C_ACCELERATED = XMLParser is _elementtree.XMLParser
+except ImportError:  # pragma: no cover – e.g. PyPy
+    _C_ACCELERATED = False
+
+try:  # Optional: lxml evaluates compiled XPath entirely in libxml2.
+    from lxml import etree as LET
+except ImportError:  # pragma: no cover – stdlib path is the default
+    LET = None
+
+_ZERO = timedelta(0)
+
+
+@dataclass(frozen=True, slots=True)
+class GPXSummary:
+    """Key session metadata extracted from one GPX file."""
+
+    path: Path
+    source_app: str
+    activity_type: str
+    start_ts_utc: datetime
+    trk_count: int
+    start_latlng: Tuple[float, float]
+    end_latlng: Tuple[float, float]
+    end_ts_utc: datetime
+    unique_extension_properties: Dict[str, int] | None = None  # only from display_all_gpx
+    # Derived once here so payload builders don't redo the tz arithmetic.
+    start_epoch: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "start_epoch", int(self.start_ts_utc.timestamp()))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain ``dict`` view (field order preserved), e.g. for ``pformat``."""
+        d = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        if d["unique_extension_properties"] is None:
+            del d["unique_extension_properties"]
+        return d
+
+
+@dataclass(frozen=True, slots=True)
+class GPXHeader:
+    """Metadata available before (or at) the first ``<trkpt>`` of a GPX file."""
+
+    path: Path
+    source_app: str
+    activity_type: str
+    start_ts_utc: datetime
+    start_latlng: Tuple[float, float]
+
+
+@dataclass(slots=True)
+class GPXSummaryTable:
+    """Column‑oriented (structure‑of‑arrays) view over many :class:`GPXSummary` rows.
+
+    Numeric columns are :class:`array.array` buffers – contiguous C doubles /
+    64‑bit ints – so scans and aggregates don't chase a pointer per record.
+    Timestamps are stored as POSIX seconds (UTC).
+    """
+
+    paths: List[Path]
+    source_apps: List[str]
+    activity_types: List[str]
+    start_ts: array  # 'd'
+    end_ts: array  # 'd'
+    trk_counts: array  # 'q'
+    start_lat: array  # 'd'
+    start_lon: array  # 'd'
+    end_lat: array  # 'd'
+    end_lon: array  # 'd'
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+@lru_cache(maxsize=64)
+def _detect_source_app(creator: str | None) -> str:
+    """Map a GPX ``creator`` attribute to a recording app (memoised per string)."""
+    if not creator:
+        return "Unknown"
+    c = creator.lower()
+    if "hoolan" in c:
+        return "Hoolan"
+    if "woo" in c:
+        return "Woo"
+    return "Unknown"
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield a read‑only mmap of *path* so parsers read straight from the page cache."""
+    with open(path, "rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # zero‑length files cannot be mapped
+            yield b""
+            return
+        with mm:
+            yield mm
 
 
 class GPXHandler:
     """Manage a directory of ``*.gpx`` files and offer quick inspection utilities."""
 
+    _GPX_NS = "http://www.topografix.com/GPX/1/1"
+    _TPX_NS = "http://www.garmin.com/xmlschemas/TrackPointExtension/v2"
+
     # Namespace map **must** include *every* prefix we reference in XPath queries.
-    _NS: Dict[str, str] = {
-        "g": "http://www.topografix.com/GPX/1/1",
-        "gpxtpx": "http://www.garmin.com/xmlschemas/TrackPointExtension/v2",
-    }
+    _NS: Dict[str, str] = {"g": _GPX_NS, "gpxtpx": _TPX_NS}
+
+    # Pre‑expanded (Clark notation) tags and paths – ``find`` skips prefix
+    # resolution entirely when no ``namespaces`` mapping is passed.
+    _METADATA_TAG = f"{{{_GPX_NS}}}metadata"
+    _NAME_TAG = f"{{{_GPX_NS}}}name"
+    _TIME_TAG = f"{{{_GPX_NS}}}time"
+    _TRKSEG_TAG = f"{{{_GPX_NS}}}trkseg"
+    _TRKPT_TAG = f"{{{_GPX_NS}}}trkpt"
+    _META_NAME_PATH = f"{_METADATA_TAG}/{_NAME_TAG}"
+    _META_TIME_PATH = f"{_METADATA_TAG}/{_TIME_TAG}"
+    _FIRST_TRKPT_TIME_PATH = f"{{{_GPX_NS}}}trk/{_TRKSEG_TAG}/{_TRKPT_TAG}/{_TIME_TAG}"
+    _TRKPT_PATH = f".//{_TRKPT_TAG}"
+    _TPX_EXT_PATH = f"{_TRKPT_PATH}/{{{_GPX_NS}}}extensions/{{{_TPX_NS}}}TrackPointExtension"
+
+    _TPX_CHILDREN_XPATH = (  # only used for lxml trees (``use_lxml=True``)
+        LET.XPath(".//g:trkpt/g:extensions/gpxtpx:TrackPointExtension/*", namespaces=_NS)
+        if LET is not None
+        else None
+    )
 
     # ---------------------------------------------------------------------
     # Construction helpers
     # ---------------------------------------------------------------------
-    def __init__(self, gpx_dir: str | Path) -> None:
+    def __init__(self, gpx_dir: str | Path, *, use_lxml: bool = False) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.directory: Path = Path(gpx_dir).expanduser().resolve()
 
@@ -29,13 +162,33 @@ class GPXHandler:
         if not self.directory.is_dir():
             raise NotADirectoryError(f"Path '{self.directory}' is not a directory.")
 
-        self.gpx_files: List[Path] = sorted(self.directory.glob("*.gpx"))
+        # path → (st_mtime_ns, st_size, summary) for :meth:`parse_gpx`.
+        self._summary_cache: Dict[Path, Tuple[int, int, GPXSummary]] = {}
+
+        if not _C_ACCELERATED:
+            self.logger.warning("C ElementTree accelerator unavailable – GPX parsing will be slow.")
+
+        # Opt‑in lxml for the DOM paths (extension counts); :meth:`parse_gpx`
+        # builds no tree and is unaffected either way.
+        self.use_lxml = use_lxml and LET is not None
+        if use_lxml and LET is None:
+            self.logger.warning("use_lxml=True but lxml is not installed – using ElementTree.")
+
+    @cached_property
+    def gpx_files(self) -> List[Path]:
+        """Sorted ``*.gpx`` files in :attr:`directory`, listed on first access."""
+        # ``DirEntry.is_file`` reuses the readdir type field – no stat per regular
+        # entry (symlinks are still followed, and so stat‑ed).
+        with os.scandir(self.directory) as it:
+            paths = [Path(e.path) for e in it if e.name.endswith(".gpx") and e.is_file()]
+        paths.sort()
         self.logger.info(
             "Discovered %d GPX file%s in '%s'.",
-            len(self),
-            "" if len(self) == 1 else "s",
+            len(paths),
+            "" if len(paths) == 1 else "s",
             self.directory,
         )
+        return paths
 
     # ---------------------------------------------------------------------
     # Dunder niceties
@@ -56,87 +209,192 @@ class GPXHandler:
     def _parse_iso8601_to_utc(ts: str) -> datetime:
         """Return an *aware* UTC datetime for any RFC 3339 / ISO‑8601 string."""
         ts = ts.strip()
-        if ts.endswith("Z"):
-            ts = ts[:-1] + "+00:00"
-        return datetime.fromisoformat(ts).astimezone(timezone.utc)
+        if ts.endswith("Z"):  # the overwhelmingly common case – already UTC
+            return datetime.fromisoformat(ts[:-1]).replace(tzinfo=timezone.utc)
+        dt = datetime.fromisoformat(ts)
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=timezone.utc)
+        return dt if dt.utcoffset() == _ZERO else dt.astimezone(timezone.utc)
 
-    @staticmethod
-    def _detect_source_app(creator: str | None) -> str:
-        if not creator:
-            return "Unknown"
-        c = creator.lower()
-        if "hoolan" in c:
-            return "Hoolan"
-        if "woo" in c:
-            return "Woo"
-        return "Unknown"
 
     # ---------------------------------------------------------------------
     # Core parsing
     # ---------------------------------------------------------------------
-    def parse_gpx(self, gpx_file: str | Path) -> Dict[str, Any]:
+    def _load_root(self, path: Path) -> Any:
+        """Build the DOM for *path* – an ``ET.Element``, or an lxml element with ``use_lxml``."""
+        if self.use_lxml:
+            return LET.parse(str(path)).getroot()
+        parser = XMLParser()
+        with _mapped(path) as buf:
+            parser.feed(buf)
+        return parser.close()
+
+    def parse_gpx(self, gpx_file: str | Path) -> GPXSummary:
         """Extract key session metadata from *gpx_file*."""
+        return self.parse_listed_gpx(Path(gpx_file).expanduser().resolve())
+
+    def parse_listed_gpx(self, path: Path, st: os.stat_result | None = None) -> GPXSummary:
+        """Like :meth:`parse_gpx` for an already‑resolved *path*, e.g. from iterating the handler.
+
+        Skips the ``expanduser``/``resolve`` normalisation (one ``lstat`` per
+        path component); the file itself is ``stat``‑ed once to validate the
+        summary cache – pass *st* if the caller already has it.
+        """
+        if st is None:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(path) from None
+        if not S_ISREG(st.st_mode):
+            raise FileNotFoundError(path)
+
+        # Unchanged files (same mtime + size) are served from the cache.
+        cached = self._summary_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        summary = self._expat_summary(path)
+        self._summary_cache[path] = (st.st_mtime_ns, st.st_size, summary)
+        return summary
+
+    def _expat_summary(self, path: Path) -> GPXSummary:
+        """Stream *path* through expat and extract the same metadata as :meth:`_parse_root`.
+
+        No element tree is built at all – see :class:`_ExpatSummaryParser`.
+        """
+        with _mapped(path) as buf:
+            p = _ExpatSummaryParser().parse(buf)
+
+        creator, name_text = p.creator, p.name
+        meta_time_text, first_time_text, last_time_text = p.meta_time, p.first_time, p.last_time
+        first_latlon, last_latlon, count = p.first_latlon, p.last_latlon, p.count
+
+        start_text = meta_time_text or first_time_text
+        if not start_text:
+            raise ValueError(f"No <time> tag found in '{path.name}'.")
+        if first_latlon is None:
+            raise ValueError(f"No <trkpt> elements found in '{path.name}'.")
+        if not last_time_text:
+            raise ValueError(f"Last <trkpt> missing <time> in '{path.name}'.")
+
+        return GPXSummary(
+            path=path,
+            source_app=_detect_source_app(creator),
+            # Labels repeat across every file from the same app – share one str object.
+            activity_type=sys.intern(name_text.strip()) if name_text else "Unknown Activity",
+            start_ts_utc=self._parse_iso8601_to_utc(start_text),
+            trk_count=count,
+            start_latlng=(float(first_latlon[0]), float(first_latlon[1])),
+            end_latlng=(float(last_latlon[0]), float(last_latlon[1])),
+            end_ts_utc=self._parse_iso8601_to_utc(last_time_text),
+        )
+
+    def parse_metadata_only(self, gpx_file: str | Path, chunk_size: int = 8192) -> GPXHeader:
+        """Read just the header of *gpx_file* – cheap directory scans.
+
+        The file is fed to expat in *chunk_size* pieces and parsing stops as
+        soon as a ``<trkpt>`` has closed and the start time is known (metadata
+        time, else the first timed trkpt), so the bulk of the track is never
+        read from disk. Missing start time or trackpoints are rejected exactly
+        as :meth:`parse_gpx` rejects them; only the checks that need the *last*
+        trkpt are skipped.
+        """
         path = Path(gpx_file).expanduser().resolve()
         if not path.is_file():
             raise FileNotFoundError(path)
 
-        root = ET.parse(path).getroot()
+        with open(path, "rb") as fh:
+            p = _ExpatSummaryParser(header_only=True).parse_stream(fh, chunk_size)
 
-        summary: Dict[str, Any] = {
-            "path": path,
-            "source_app": self._detect_source_app(root.get("creator")),
-            "activity_type": "Unknown Activity",
-        }
+        start_text = p.meta_time or p.first_time
+        if not start_text:
+            raise ValueError(f"No <time> tag found in '{path.name}'.")
+        if p.first_latlon is None:
+            raise ValueError(f"No <trkpt> elements found in '{path.name}'.")
 
-        name_el = root.find("g:metadata/g:name", self._NS)
+        return GPXHeader(
+            path=path,
+            source_app=_detect_source_app(p.creator),
+            activity_type=sys.intern(p.name.strip()) if p.name else "Unknown Activity",
+            start_ts_utc=self._parse_iso8601_to_utc(start_text),
+            start_latlng=(float(p.first_latlon[0]), float(p.first_latlon[1])),
+        )
+
+    def _parse_root(self, root: ET.Element, path: Path) -> GPXSummary:
+        """Extract session metadata from an already‑parsed GPX *root*."""
+        activity_type = "Unknown Activity"
+        name_el = root.find(self._META_NAME_PATH)
         if name_el is not None and name_el.text:
-            summary["activity_type"] = name_el.text.strip()
+            activity_type = sys.intern(name_el.text.strip())
 
-        meta_time_el = root.find("g:metadata/g:time", self._NS)
+        meta_time_el = root.find(self._META_TIME_PATH)
         if meta_time_el is not None and meta_time_el.text:
             start_ts = self._parse_iso8601_to_utc(meta_time_el.text)
         else:
-            first_time_el = root.find("g:trk/g:trkseg/g:trkpt/g:time", self._NS)
+            first_time_el = root.find(self._FIRST_TRKPT_TIME_PATH)
             if first_time_el is None or not first_time_el.text:
                 raise ValueError(f"No <time> tag found in '{path.name}'.")
             start_ts = self._parse_iso8601_to_utc(first_time_el.text)
-        summary["start_ts_utc"] = start_ts
 
-        trkpts = root.findall(".//g:trkpt", self._NS)
-        if not trkpts:
+        # Walk the trackpoints lazily – only the first/last element and a count
+        # are needed, so never materialise the full list.
+        trkpts = root.iterfind(self._TRKPT_PATH)
+        first_pt = next(trkpts, None)
+        if first_pt is None:
             raise ValueError(f"No <trkpt> elements found in '{path.name}'.")
 
-        summary["trk_count"] = len(trkpts)
-        first_pt, last_pt = trkpts[0], trkpts[-1]
-        summary["start_latlng"] = (float(first_pt.get("lat")), float(first_pt.get("lon")))
-        summary["end_latlng"] = (float(last_pt.get("lat")), float(last_pt.get("lon")))
+        last_pt = first_pt
+        count = 1
+        for last_pt in trkpts:
+            count += 1
 
-        last_time_el = last_pt.find("g:time", self._NS)
+        last_time_el = last_pt.find(self._TIME_TAG)
         if last_time_el is None or not last_time_el.text:
             raise ValueError(f"Last <trkpt> missing <time> in '{path.name}'.")
-        summary["end_ts_utc"] = self._parse_iso8601_to_utc(last_time_el.text)
 
-        return summary
+        return GPXSummary(
+            path=path,
+            source_app=_detect_source_app(root.get("creator")),
+            activity_type=activity_type,
+            start_ts_utc=start_ts,
+            trk_count=count,
+            start_latlng=(float(first_pt.get("lat")), float(first_pt.get("lon"))),
+            end_latlng=(float(last_pt.get("lat")), float(last_pt.get("lon"))),
+            end_ts_utc=self._parse_iso8601_to_utc(last_time_el.text),
+        )
 
     # ---------------------------------------------------------------------
     # Extension‑property inspector
     # ---------------------------------------------------------------------
     def _extension_counts(self, root: ET.Element) -> Dict[str, int]:
         """Return counts of each sub‑tag inside ``<gpxtpx:TrackPointExtension>``."""
+        raw: defaultdict[str, int] = defaultdict(int)
+        if LET is not None and isinstance(root, LET._Element):
+            for child in self._TPX_CHILDREN_XPATH(root):
+                raw[child.tag] += 1
+        else:
+            for ext_el in root.iterfind(self._TPX_EXT_PATH):
+                for child in ext_el:
+                    raw[child.tag] += 1
+
+        # Strip namespaces once per *distinct* tag rather than once per element.
         counts: Dict[str, int] = {}
-        xpath = ".//g:trkpt/g:extensions/gpxtpx:TrackPointExtension"
-        for ext_el in root.findall(xpath, self._NS):
-            for child in ext_el:
-                tag_local = child.tag.rpartition("}")[2]  # strip namespace
-                counts[tag_local] = counts.get(tag_local, 0) + 1
+        for tag, n in raw.items():
+            tag_local = sys.intern(tag.rpartition("}")[2])
+            counts[tag_local] = counts.get(tag_local, 0) + n
         return counts
 
     # ---------------------------------------------------------------------
     # Public display helpers
     # ---------------------------------------------------------------------
-    def display_gpx(self, gpx_file: str | Path) -> Dict[str, Any]:
+    def display_gpx(self, gpx_file: str | Path) -> GPXSummary:
         summary = self.parse_gpx(gpx_file)
-        self.logger.info("GPX summary for %s:\n%s", Path(gpx_file).name, pformat(summary, indent=2, sort_dicts=False))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "GPX summary for %s:\n%s",
+                Path(gpx_file).name,
+                pformat(summary.as_dict(), indent=2, sort_dicts=False),
+            )
         return summary
 
     def display_unique_trkpt_properties(self, gpx_file: str | Path) -> Dict[str, Any]:
@@ -144,22 +402,176 @@ class GPXHandler:
         if not path.is_file():
             raise FileNotFoundError(path)
 
-        root = ET.parse(path).getroot()
+        root = self._load_root(path)
         counts = self._extension_counts(root)
         summary = {"file_name": path.name, "unique_extension_properties": counts}
-        self.logger.info(
-            "Extension property counts for %s:\n%s", path.name, pformat(summary, indent=2, sort_dicts=False)
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Extension property counts for %s:\n%s", path.name, pformat(summary, indent=2, sort_dicts=False)
+            )
         return summary
 
-    def display_all_gpx(self) -> List[Dict[str, Any]]:
-        """Log a merged core‑metadata + extension‑property summary for every file."""
-        combined: List[Dict[str, Any]] = []
+    def _parse_one_combined(self, path: Path) -> GPXSummary:
+        """Core metadata + extension counts for *path* from a single parse."""
+        root = self._load_root(path)
+        return replace(self._parse_root(root, path), unique_extension_properties=self._extension_counts(root))
+
+    def summarize_all(self) -> GPXSummaryTable:
+        """Parse every file into a columnar :class:`GPXSummaryTable`.
+
+        Uses the cached streaming parser (no extension counts). Files that fail
+        to parse are logged and left out of the table.
+        """
+        n = len(self.gpx_files)
+        paths: List[Path] = [None] * n  # type: ignore[list-item]
+        source_apps: List[str] = [""] * n
+        activity_types: List[str] = [""] * n
+        start_ts, end_ts = array("d", [0.0]) * n, array("d", [0.0]) * n
+        trk_counts = array("q", [0]) * n
+        start_lat, start_lon = array("d", [0.0]) * n, array("d", [0.0]) * n
+        end_lat, end_lon = array("d", [0.0]) * n, array("d", [0.0]) * n
+
+        i = 0
         for path in self.gpx_files:
-            root = ET.parse(path).getroot()
-            meta = self.parse_gpx(path)
-            meta["unique_extension_properties"] = self._extension_counts(root)
-            self.logger.info("Full summary for %s:\n%s", path.name, pformat(meta, indent=2, sort_dicts=False))
-            combined.append(meta)
-        self.logger.info("Displayed %d combined summaries from '%s'.", len(combined), self.directory)
+            try:
+                s = self.parse_listed_gpx(path)
+            except Exception as exc:  # noqa: BLE001 – broad but logged
+                self.logger.error("GPX parse failed for %s: %s", path.name, exc)
+                continue
+            paths[i], source_apps[i], activity_types[i] = s.path, s.source_app, s.activity_type
+            start_ts[i], end_ts[i] = s.start_ts_utc.timestamp(), s.end_ts_utc.timestamp()
+            trk_counts[i] = s.trk_count
+            start_lat[i], start_lon[i] = s.start_latlng
+            end_lat[i], end_lon[i] = s.end_latlng
+            i += 1
+
+        columns = (
+            paths, source_apps, activity_types, start_ts, end_ts, trk_counts, start_lat, start_lon, end_lat, end_lon
+        )
+        for col in columns:
+            del col[i:]  # drop slots reserved for files that failed to parse
+        return GPXSummaryTable(*columns)
+
+    def display_all_gpx(self, max_workers: int | None = None) -> List[GPXSummary]:
+        """Log a merged core‑metadata + extension‑property summary for every file.
+
+        Files are parsed concurrently on a thread pool (*max_workers* defaults
+        to the executor's own choice); results keep directory order and are
+        logged as a single record once all parses are done.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            combined = list(ex.map(self._parse_one_combined, self.gpx_files))
+        if self.logger.isEnabledFor(logging.INFO):  # skip pformat entirely when muted
+            # One record for the whole batch – a handler round‑trip per file adds up.
+            body = "\n".join(
+                f"Full summary for {meta.path.name}:\n{pformat(meta.as_dict(), indent=2, sort_dicts=False)}"
+                for meta in combined
+            )
+            self.logger.info("Displayed %d combined summaries from '%s'.\n%s", len(combined), self.directory, body)
         return combined
+
+
+class _ExpatSummaryParser:
+    """Expat state machine collecting just what :meth:`GPXHandler.parse_gpx` needs.
+
+    No element objects are created: the handlers track nesting depth, copy the
+    ``lat``/``lon`` of each ``<trkpt>`` and only subscribe to character data
+    while inside a ``<name>``/``<time>`` of interest.
+    """
+
+    _GPX = f"{GPXHandler._GPX_NS} gpx"  # expat joins namespace + local name with " "
+    _METADATA = f"{GPXHandler._GPX_NS} metadata"
+    _NAME = f"{GPXHandler._GPX_NS} name"
+    _TIME = f"{GPXHandler._GPX_NS} time"
+    _TRKPT = f"{GPXHandler._GPX_NS} trkpt"
+
+    class _Stop(Exception):
+        """Raised from a handler to abandon the parse early."""
+
+    def __init__(self, *, header_only: bool = False) -> None:
+        # Stop once a trkpt has closed *and* a start time is known.
+        self._header_only = header_only
+
+        self.creator: str | None = None
+        self.name: str | None = None
+        self.meta_time: str | None = None
+        self.first_latlon: Tuple[str, str] | None = None
+        self.first_time: str | None = None
+        self.last_latlon: Tuple[str, str] | None = None
+        self.last_time: str | None = None
+        self.count = 0
+
+        # Depths of the currently open elements of interest (-1 = not open).
+        self._depth = 0
+        self._meta_depth = -1
+        self._trkpt_depth = -1
+        self._capture_depth = -1
+        self._capture_attr = ""
+        self._buf: List[str] = []
+        self._pt_latlon: Tuple[str, str] | None = None
+        self._pt_time: str | None = None
+
+        self._parser = ParserCreate(namespace_separator=" ")
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+
+    def parse(self, data: bytes | mmap.mmap) -> _ExpatSummaryParser:
+        self._parser.Parse(data, True)
+        return self
+
+    def parse_stream(self, fh: BinaryIO, chunk_size: int) -> _ExpatSummaryParser:
+        """Feed *fh* incrementally; returns early if a handler requested a stop."""
+        try:
+            while chunk := fh.read(chunk_size):
+                self._parser.Parse(chunk, False)
+            self._parser.Parse(b"", True)
+        except self._Stop:
+            pass
+        return self
+
+    # ––––– expat callbacks –––––
+    def _capture(self, attr: str) -> None:
+        self._capture_depth = self._depth
+        self._capture_attr = attr
+        self._buf = []
+        self._parser.CharacterDataHandler = self._buf.append
+
+    def _start(self, name: str, attrs: Dict[str, str]) -> None:
+        self._depth += 1
+        d = self._depth
+        if name == self._TRKPT:
+            self._trkpt_depth = d
+            self._pt_latlon = (attrs.get("lat"), attrs.get("lon"))
+            self._pt_time = None
+        elif name == self._TIME:
+            if d == self._trkpt_depth + 1:
+                self._capture("_pt_time")
+            elif d == self._meta_depth + 1:
+                self._capture("meta_time")
+        elif name == self._NAME and d == self._meta_depth + 1:
+            self._capture("name")
+        elif name == self._METADATA:
+            self._meta_depth = d
+        elif name == self._GPX and d == 1:
+            self.creator = attrs.get("creator")
+
+    def _end(self, name: str) -> None:
+        d = self._depth
+        self._depth -= 1
+        if d == self._capture_depth:
+            setattr(self, self._capture_attr, "".join(self._buf))
+            self._parser.CharacterDataHandler = None
+            self._capture_depth = -1
+        elif d == self._trkpt_depth:
+            self.count += 1
+            self.last_latlon, self.last_time = self._pt_latlon, self._pt_time
+            if self.first_latlon is None:
+                self.first_latlon = self._pt_latlon
+            if self.first_time is None and self._pt_time:
+                self.first_time = self._pt_time
+            self._trkpt_depth = -1
+            if self._header_only and (self.meta_time or self.first_time):
+                raise self._Stop
+        elif d == self._meta_depth:
+            self._meta_depth = -1
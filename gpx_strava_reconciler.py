@@ -14,28 +14,73 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Tuple
+
+try:  # Optional C parser for ISO‑8601; ~10× faster than the stdlib path below.
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:  # pragma: no cover – stdlib fallback
+    if sys.version_info >= (3, 11):
+        # Accepts the trailing "Z" natively; C‑implemented, no string rebuild.
+        _parse_iso8601 = datetime.fromisoformat
+    else:
+
+        def _parse_iso8601(ts: str) -> datetime:
+            # Strava's format is fixed – "YYYY-MM-DDTHH:MM:SSZ" – so slice the
+            # fields directly instead of rewriting "Z" for ``fromisoformat``.
+            if len(ts) == 20 and ts[19] == "Z":
+                return datetime(
+                    int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                    int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+                    tzinfo=timezone.utc,
+                )
+            return datetime.fromisoformat(ts)
+
+if TYPE_CHECKING:
+    from gpx_handler import GPXSummary
 
 logger = logging.getLogger(__name__)
 
+try:  # Optional C JSON encoder; only used for debug dumps.
+    import orjson
+
+    def _dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # pragma: no cover – stdlib fallback
+
+    def _dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Parsed GPX metadata persisted between runs, keyed by path + (mtime, size).
+_DEFAULT_META_CACHE = (
+    Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser() / "kite-sessions" / "gpx_meta.pkl"
+)
+_META_CACHE_VERSION = 2  # bump whenever GPXSummary's fields change
+
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
 # ────────────────────────────────────────────────────────────────────────────────
-# Helper dataclasses
+# Helper types
 # ────────────────────────────────────────────────────────────────────────────────
-@dataclass(frozen=True, slots=True)
-class ActivitySignature:
-    """A fuzzy fingerprint for duplicate detection."""
-
-    start_min: int  # minutes‑since‑epoch (UTC), rounded
-    dur_min: int    # elapsed minutes, rounded
-    lat4: float     # start‑lat rounded to 4 decimals
-    lon4: float     # start‑lon rounded to 4 decimals
+# A fuzzy fingerprint for duplicate detection – a plain tuple so hashing and
+# equality run in C rather than through dataclass‑generated methods:
+#   (start_min, dur_min, lat4, lon4)
+#   start_min – minutes‑since‑epoch (UTC), rounded
+#   dur_min   – elapsed minutes, rounded
+#   lat4/lon4 – start position rounded to 4 decimals
+ActivitySignature = Tuple[int, int, float, float]
 
 
-@dataclass(frozen=True, slots=True)
-class GpxUploadJob:
+class GpxUploadJob(NamedTuple):
     gpx_path: Path
     payload: Dict[str, Any]  # keys expected by Strava ``/uploads``
 
@@ -44,13 +89,50 @@ class GpxUploadJob:
 # GPX→Strava activity‑type mapping
 # See <https://developers.strava.com/docs/reference/#api-models-SportType>
 # ────────────────────────────────────────────────────────────────────────────────
-_STRAVA_SPORT_MAP: dict[str | None, str] = {
+class _SportMap(dict):
+    """Label → Strava ``sport_type``; unknown labels fall back to ``Workout``."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str | None) -> str:
+        return "Workout"
+
+
+_STRAVA_SPORT_MAP: Dict[str | None, str] = _SportMap({
     "Kiteboarding": "Kitesurf",
     "Kite Landboarding": "Kitesurf",  # closest native type
     "Windsurfing": "Windsurf",
     "Wing Foiling": "Windsurf",
-    None: "Workout",  # fallback for unknown labels
-}
+})
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Process‑pool workers (module level so they pickle by reference)
+# ────────────────────────────────────────────────────────────────────────────────
+_worker_handler = None  # set once per worker process by ``_init_parse_worker``
+
+# Never ``fork``: by the time GPX files are parsed the Strava client may still
+# have page‑fetch threads alive, and forking a threaded process can deadlock.
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _safe_parse(gpx_handler, path: Path, st: os.stat_result) -> GPXSummary | Exception:
+    """Parse *path*, returning (not raising) any error so one bad file can't abort a batch."""
+    try:
+        return gpx_handler.parse_listed_gpx(path, st)
+    except Exception as exc:  # noqa: BLE001 – reported by ``reconcile``
+        return exc
+
+
+def _init_parse_worker(gpx_handler) -> None:
+    global _worker_handler
+    _worker_handler = gpx_handler
+
+
+def _parse_in_worker(path: Path, st: os.stat_result) -> GPXSummary | Exception:
+    return _safe_parse(_worker_handler, path, st)
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -59,24 +141,37 @@ _STRAVA_SPORT_MAP: dict[str | None, str] = {
 class GPXStravaReconciler:
     """Build an index of Strava activities and prepare upload jobs."""
 
-    _START_OFFSETS = range(-2, 3)   # ±2 minutes tolerance
-    _DUR_OFFSETS = range(-3, 4)     # ±3 minutes tolerance
+    _PARALLEL_MIN_FILES = 8  # below this, process start‑up outweighs the parse
 
-    def __init__(self, strava_client, gpx_handler) -> None:
+    _START_TOL = 2   # ±2 minutes tolerance
+    _DUR_TOL = 3     # ±3 minutes tolerance
+
+    def __init__(self, strava_client, gpx_handler, meta_cache_path: Path | None = _DEFAULT_META_CACHE) -> None:
         self.strava = strava_client
         self.gpx_handler = gpx_handler
 
-        self._index: Dict[ActivitySignature, int] = {}
+        # str(path) → (st_mtime_ns, st_size, GPXSummary); ``None`` path disables it.
+        self._meta_cache_path = meta_cache_path
+        self._meta_cache: Dict[str, Tuple[int, int, GPXSummary]] = self._load_meta_cache()
+        self._meta_cache_dirty = False
+
+        # (lat4, lon4) → [(start_min, dur_min, activity_id), …] sorted by start_min
+        self._index: Dict[Tuple[float, float], List[Tuple[int, int, int]]] = {}
+        # Exact signature → activity_id; re‑uploads of the same recording hit here.
+        self._exact: Dict[ActivitySignature, int] = {}
         self._build_strava_index()
 
     # ––––– public API –––––
     def reconcile(self) -> List[GpxUploadJob]:
         """Return a list of **new** :class:`GpxUploadJob` objects."""
-        jobs: List[GpxUploadJob] = []
-
-        for gpx_path in self.gpx_handler:  # ``GPXHandler`` is iterable
+        paths = list(self.gpx_handler)  # ``GPXHandler`` is iterable
+        # Upper bound is one job per file: size the list once, trim at the end.
+        jobs: List[GpxUploadJob] = [None] * len(paths)  # type: ignore[list-item]
+        n_jobs = n_dup = 0
+        for gpx_path, gpx_meta in zip(paths, self._parse_all(paths)):
             try:
-                gpx_meta = self.gpx_handler.parse_gpx(gpx_path)
+                if isinstance(gpx_meta, Exception):
+                    raise gpx_meta
                 sig = self._sig_from_gpx_meta(gpx_meta)
             except Exception as exc:  # noqa: BLE001 – broad but logged
                 logger.error("GPX parse failed for %s: %s", gpx_path.name, exc)
@@ -84,106 +179,212 @@ class GPXStravaReconciler:
 
             dup_id = self._find_duplicate(sig)
             if dup_id:
-                logger.info(
+                # Per‑file detail is DEBUG (``--verbose``); the totals below are INFO.
+                logger.debug(
                     "Skipping %-30s (already on Strava id=%s)",
                     gpx_path.name,
                     dup_id,
                 )
+                n_dup += 1
                 continue
 
-            jobs.append(self._make_job(gpx_path, gpx_meta))
-            logger.info("Prepared upload for %s", gpx_path.name)
+            jobs[n_jobs] = self._make_job(gpx_path, gpx_meta)
+            n_jobs += 1
+            logger.debug("Prepared upload for %s", gpx_path.name)
 
-        logger.info("Prepared %d new upload(s) in total", len(jobs))
+        del jobs[n_jobs:]
+        self._flush_meta_cache()
+        logger.info("Reconciled: %d new, %d already on Strava", n_jobs, n_dup)
         return jobs
 
     # ––––– private helpers –––––
     def _build_strava_index(self) -> None:
         """Fetch all Strava activities once and build a lookup index."""
         logger.info("Building Strava activity index …")
-        activities = self.strava.get_logged_in_athlete_activities()
-
-        skipped = 0
+        # Streamed: the client prefetches page N+1 while page N is indexed here.
+        activities = self.strava.iter_logged_in_athlete_activities()
+
+        # Hot loop over the athlete's whole history: compute each bucket entry
+        # inline with locally bound callables – no per‑activity signature object
+        # or method dispatch. Rounding matches ``_sig_from_gpx_meta``.
+        index = self._index
+        exact_setdefault = self._exact.setdefault
+        parse_ts = _parse_iso8601
+        dump_skipped = logger.isEnabledFor(logging.DEBUG)  # pretty JSON only when it will be shown
+        indexed = skipped = 0
         for act in activities:
-            sig = self._sig_from_strava(act)
-            if sig is None:
+            coords = act.get("start_latlng") or ()
+            if len(coords) < 2:  # GPS‑less / malformed entry
                 skipped += 1
-                logger.debug(
-                    "Skipped activity with no usable GPS start point:\n%s",
-                    json.dumps(act, indent=2, ensure_ascii=False),
-                )
+                if dump_skipped:
+                    logger.debug("Skipped activity with no usable GPS start point:\n%s", _dumps_pretty(act))
                 continue
-            self._index[sig] = act["id"]
+            lat, lon = coords
+            start_min = int((parse_ts(act["start_date"]).timestamp() + 30) // 60)
+            dur_min = (act["elapsed_time"] + 30) // 60
+            lat4, lon4 = round(lat, 4), round(lon, 4)
+            index.setdefault((lat4, lon4), []).append((start_min, dur_min, act["id"]))
+            exact_setdefault((start_min, dur_min, lat4, lon4), act["id"])
+            indexed += 1
+
+        for bucket in index.values():
+            bucket.sort()  # by start_min, so lookups can bisect to the tolerance window
 
         logger.info(
             "Indexed %d Strava activities (%d skipped for missing GPS)",
-            len(self._index),
+            indexed,
             skipped,
         )
 
+    # GPX metadata cache -------------------------------------------------
+    def _load_meta_cache(self) -> Dict[str, Tuple[int, int, GPXSummary]]:
+        if self._meta_cache_path is None or not self._meta_cache_path.is_file():
+            return {}
+        try:
+            with self._meta_cache_path.open("rb") as fh:
+                version, cache = pickle.load(fh)
+        except Exception as exc:  # noqa: BLE001 – stale/corrupt cache is not fatal
+            logger.warning("Ignoring unreadable GPX metadata cache %s: %s", self._meta_cache_path, exc)
+            return {}
+        if version != _META_CACHE_VERSION:
+            logger.info("Discarding GPX metadata cache from an older version (%s)", version)
+            return {}
+        logger.debug("Loaded %d cached GPX summaries from %s", len(cache), self._meta_cache_path)
+        return cache
+
+    def _flush_meta_cache(self) -> None:
+        """Atomically persist the cache (write temp file, then ``os.replace``)."""
+        if self._meta_cache_path is None or not self._meta_cache_dirty:
+            return
+        try:
+            self._meta_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._meta_cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump((_META_CACHE_VERSION, self._meta_cache), fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._meta_cache_path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning("Could not write GPX metadata cache %s: %s", self._meta_cache_path, exc)
+            return
+        self._meta_cache_dirty = False
+
+    def _parse_all(self, paths: List[Path]) -> List[GPXSummary | Exception]:
+        """Return one summary (or the parse error) per path, in order.
+
+        Each file is ``stat``‑ed exactly once here and the result is handed
+        down to the handler. Empty files are rejected without opening them,
+        files whose (mtime + size) match the cache are not re‑parsed, and the
+        rest are parsed on a process pool when there are enough of them to
+        amortise worker start‑up, otherwise inline. Cache entries for paths
+        no longer listed are dropped.
+        """
+        results: List[GPXSummary | Exception | None] = [None] * len(paths)
+        misses: List[Tuple[int, Path, os.stat_result]] = []
+        for i, path in enumerate(paths):
+            try:
+                st = path.stat()
+            except OSError as exc:
+                results[i] = exc
+                continue
+            if st.st_size == 0:
+                results[i] = ValueError(f"'{path.name}' is empty.")
+                continue
+            hit = self._meta_cache.get(str(path))
+            if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                results[i] = hit[2]
+            else:
+                misses.append((i, path, st))
+
+        miss_paths = [path for _, path, _ in misses]
+        miss_stats = [st for _, _, st in misses]
+        parsed: List[GPXSummary | Exception] | None = None
+        if len(miss_paths) >= self._PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(
+                    mp_context=_POOL_CONTEXT,
+                    initializer=_init_parse_worker,
+                    initargs=(self.gpx_handler,),
+                ) as ex:
+                    parsed = list(ex.map(_parse_in_worker, miss_paths, miss_stats, chunksize=4))
+            except Exception as exc:  # noqa: BLE001 – e.g. unpicklable handler; fall back
+                logger.warning("Parallel GPX parsing unavailable (%s); parsing serially", exc)
+        if parsed is None:
+            parsed = [_safe_parse(self.gpx_handler, path, st) for path, st in zip(miss_paths, miss_stats)]
+
+        for (i, path, st), meta in zip(misses, parsed):
+            results[i] = meta
+            if not isinstance(meta, Exception):
+                self._meta_cache[str(path)] = (st.st_mtime_ns, st.st_size, meta)
+                self._meta_cache_dirty = True
+
+        # Forget files that were deleted or renamed since they were cached.
+        current = {str(path) for path in paths}
+        stale = [key for key in self._meta_cache if key not in current]
+        for key in stale:
+            del self._meta_cache[key]
+        if stale:
+            self._meta_cache_dirty = True
+        return results  # type: ignore[return-value]  # every slot is filled above
+
     # signature builders ---------------------------------------------------
     @staticmethod
-    def _round_min(dt: datetime) -> int:
-        """Round a *datetime* to the nearest minute and return minutes‑since‑epoch."""
-        return int(round(dt.timestamp() / 60))
-
-    def _sig_from_gpx_meta(self, meta: Dict[str, Any]) -> ActivitySignature:
-        start_ts: datetime = meta["start_ts_utc"]
-        end_ts: datetime = meta["end_ts_utc"]
-        dur_min = int(round((end_ts - start_ts).total_seconds() / 60))
-        lat, lon = meta["start_latlng"]
-        return ActivitySignature(
-            self._round_min(start_ts),
-            dur_min,
-            round(lat, 4),
-            round(lon, 4),
-        )
-
-    def _sig_from_strava(self, act: Dict[str, Any]) -> ActivitySignature | None:
-        start_utc = datetime.fromisoformat(act["start_date"].replace("Z", "+00:00"))
-        dur_min = int(round(act["elapsed_time"] / 60))
+    def _round_min(ts: float) -> int:
+        """Round POSIX seconds *ts* to the nearest minute and return minutes‑since‑epoch."""
+        return int((ts + 30) // 60)
 
-        coords = act.get("start_latlng", [])
-        if len(coords) < 2:
-            return None  # GPS‑less / malformed entry
-        lat, lon = coords
-
-        return ActivitySignature(
-            self._round_min(start_utc),
-            dur_min,
-            round(lat, 4),
-            round(lon, 4),
-        )
+    def _sig_from_gpx_meta(self, meta: GPXSummary) -> ActivitySignature:
+        start_ts = meta.start_ts_utc.timestamp()
+        dur_min = self._round_min(meta.end_ts_utc.timestamp() - start_ts)
+        lat, lon = meta.start_latlng
+        return (self._round_min(start_ts), dur_min, round(lat, 4), round(lon, 4))
 
     # duplicate check ------------------------------------------------------
     def _find_duplicate(self, sig: ActivitySignature) -> int | None:
-        """Return Strava **activity‑id** if *sig* (or a fuzzy variant) exists."""
-        m0 = sig.start_min
-        d0 = sig.dur_min
-        lat = sig.lat4
-        lon = sig.lon4
-
-        for dt in self._START_OFFSETS:
-            for dd in self._DUR_OFFSETS:
-                probe = ActivitySignature(m0 + dt, d0 + dd, lat, lon)
-                if probe in self._index:
-                    return self._index[probe]
-        return None
+        """Return Strava **activity‑id** if *sig* (or a fuzzy variant) exists.
+
+        Fast path: one probe for the exact signature (the common case when the
+        same recording was uploaded before). Otherwise one hash probe on the
+        start location, bisect to the ±tolerance start window and return the
+        nearest candidate (Manhattan distance over start/duration minutes).
+        """
+        hit = self._exact.get(sig)
+        if hit is not None:
+            return hit
+
+        m0, d0, lat4, lon4 = sig
+        bucket = self._index.get((lat4, lon4))
+        if not bucket:
+            return None
+
+        best_id: int | None = None
+        best_dist = self._START_TOL + self._DUR_TOL + 1
+        m_hi = m0 + self._START_TOL
+        for i in range(bisect_left(bucket, (m0 - self._START_TOL,)), len(bucket)):
+            m, d, act_id = bucket[i]
+            if m > m_hi:
+                break
+            dd = abs(d - d0)
+            if dd <= self._DUR_TOL and abs(m - m0) + dd < best_dist:
+                best_id, best_dist = act_id, abs(m - m0) + dd
+        return best_id
 
     # payload prep ---------------------------------------------------------
-    def _make_job(self, path: Path, meta: Dict[str, Any]) -> GpxUploadJob:
+    def _make_job(self, path: Path, meta: GPXSummary) -> GpxUploadJob:
         """Build the multipart/form‑data *payload* Strava expects."""
-        sport = _STRAVA_SPORT_MAP.get(meta.get("activity_type"), "Workout")
+        sport = _STRAVA_SPORT_MAP[meta.activity_type]
 
         payload: Dict[str, Any] = {
             "data_type": "gpx",
             # Strava uses ``external_id`` for duplicate detection on their side.
-            "external_id": f"{path.stem}-{int(meta['start_ts_utc'].timestamp())}",
-            "name": meta.get("activity_type") or path.stem.replace("_", " "),
+            "external_id": f"{path.stem}-{meta.start_epoch}",
+            "name": meta.activity_type or path.stem.translate(_UNDERSCORE_TO_SPACE),
             "sport_type": sport,
             "description": (
-                f"Imported from {meta.get('source_app', 'GPX')} on "
-                f"{meta['start_ts_utc'].date()}"
+                f"Imported from {meta.source_app} on "
+                f"{meta.start_ts_utc.date()}"
             ),
             "trainer": 0,  # 1 = stationary / turbo‑trainer
             "commute": 0,
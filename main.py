@@ -56,6 +56,12 @@ def _parse_args(argv: List[str] | None = None):  # noqa: D401
         action="store_true",
         help="Don't poll Strava for processing status (faster).",
     )
+    p.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable DEBUG logging (per-file reconcile decisions, etc.).",
+    )
     return p.parse_args(argv)
 
 
@@ -65,6 +71,8 @@ def _parse_args(argv: List[str] | None = None):  # noqa: D401
 
 def main(argv: List[str] | None = None):  # noqa: D401
     args = _parse_args(argv)
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
 
     logger.info("Starting Strava GPX uploader — dry_run=%s", args.dry_run)
 
@@ -82,10 +82,27 @@ def list_gpx_files(directory: str) -> List[Path]:
     if not path_obj.is_dir():
         logging.error(f"Provided path {directory} is not a directory.")
         return []
-    gpx_files = list(path_obj.rglob("*.gpx"))
+    gpx_files = list(_iter_gpx_files(directory))
     logging.info(f"Found {len(gpx_files)} GPX files in {directory}")
     return gpx_files
 
+def _iter_gpx_files(directory: str):
+    """
+    Recursively yield .gpx files under directory using os.scandir directly,
+    which avoids rglob's per-entry Path wrapping and pattern matching.
+    Unreadable directories are skipped, as rglob does.
+    """
+    try:
+        entries = os.scandir(directory)
+    except PermissionError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_gpx_files(entry.path)
+            elif entry.name.endswith(".gpx"):
+                yield Path(entry.path)
+
 def parse_gpx_metadata(gpx_file: Path) -> Optional[Dict[str, str]]:
     """
     Parse the GPX file’s metadata for name and time.
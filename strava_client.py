@@ -22,14 +22,26 @@ import json
 import logging
 import os
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# OAuth tokens persisted between runs (mode 0600) so a fresh process can skip
+# the refresh round‑trip while the access token is still valid (~6 h).
+_DEFAULT_TOKEN_CACHE = (
+    Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser() / "kite-strava" / "token.json"
+)
+_TOKEN_MIN_TTL = 60  # seconds a cached access token must have left to be reused
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -57,7 +69,7 @@ class StravaClient:
     BASE_URL = "https://www.strava.com/api/v3"
     TOKEN_URL = "https://www.strava.com/oauth/token"
 
-    def __init__(self) -> None:
+    def __init__(self, token_cache_path: Optional[Path] = _DEFAULT_TOKEN_CACHE) -> None:
         self.client_id = os.getenv("STRAVA_CLIENT_ID")
         self.client_secret = os.getenv("STRAVA_CLIENT_SECRET")
         self.refresh_token = os.getenv("STRAVA_REFRESH_TOKEN")
@@ -70,8 +82,21 @@ class StravaClient:
 
         self.access_token: Optional[str] = None
         self.expires_at: Optional[int] = None  # Unix ts
-
-        self._authenticate()
+        self._token_cache_path = token_cache_path
+        # The env token a cache entry descends from; a different one in the
+        # environment (e.g. another athlete) invalidates the cache.
+        self._seed_refresh_token = self.refresh_token
+        self._auth_lock = threading.Lock()  # single‑flight refresh, see _refresh_rejected
+
+        # One pooled session for every call: all traffic goes to strava.com, so
+        # keep-alive saves a TCP + TLS handshake per request after the first.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        if not self._load_cached_token():
+            self._authenticate()
 
     # ---------------------------------------------------------------------
     # Authentication helpers
@@ -88,62 +113,183 @@ class StravaClient:
         logger.info("Authenticating with Strava (refresh‑token flow)…")
 
         try:
-            resp = requests.post(self.TOKEN_URL, data=payload, timeout=10)
+            # ``None`` drops the session's bearer default: /oauth/token must not
+            # receive the (possibly just rejected) access token.
+            resp = self._session.post(self.TOKEN_URL, data=payload, headers={"Authorization": None}, timeout=10)
             resp.raise_for_status()
         except requests.RequestException as exc:
             raise StravaAuthError(f"Token request failed: {exc}") from exc
 
         token_data = resp.json()
         self.access_token = token_data["access_token"]
+        self._session.headers["Authorization"] = f"Bearer {self.access_token}"
         self.refresh_token = token_data["refresh_token"]  # might rotate
         self.expires_at = token_data["expires_at"]
 
         ttl = self.expires_at - int(time.time())
         logger.info("Authentication OK – token valid for %.1f min", ttl / 60)
+        self._store_token()
+
+    def _load_cached_token(self) -> bool:
+        """Adopt the token saved by a previous run; *True* if no refresh is needed.
+
+        A matching cache always contributes its (possibly rotated) refresh
+        token; the access token is only reused with ``_TOKEN_MIN_TTL`` to spare.
+        """
+        path = self._token_cache_path
+        if path is None or not path.is_file():
+            return False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["client_id"] != self.client_id or data["seed_refresh_token"] != self._seed_refresh_token:
+                logger.debug("Token cache %s belongs to other credentials; ignoring it", path)
+                return False
+            access_token, refresh_token = data["access_token"], data["refresh_token"]
+            expires_at = int(data["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable token cache %s: %s", path, exc)
+            return False
+
+        self.refresh_token = refresh_token
+        ttl = expires_at - time.time()
+        if ttl <= _TOKEN_MIN_TTL:
+            return False
+        self.access_token, self.expires_at = access_token, expires_at
+        self._session.headers["Authorization"] = f"Bearer {self.access_token}"
+        logger.info("Reusing cached Strava token – valid for %.1f min", ttl / 60)
+        return True
+
+    def _store_token(self) -> None:
+        """Atomically persist the current tokens, readable by the owner only."""
+        path = self._token_cache_path
+        if path is None:
+            return
+        data = {
+            "client_id": self.client_id,
+            "seed_refresh_token": self._seed_refresh_token,
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": self.expires_at,
+        }
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(data, fh)
+                os.chmod(tmp, 0o600)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning("Could not write token cache %s: %s", path, exc)
 
     # ---------------------------------------------------------------------
     # Low‑level request helper
     # ---------------------------------------------------------------------
-    def _req(self, method: str, path: str, **kw):
-        """Wrap *requests* with auto‑refresh + uniform error handling."""
-        # Refresh if token is within 30 s of expiry
-        if self.expires_at and time.time() > self.expires_at - 30:
-            self._authenticate()
-
-        kw.setdefault("timeout", 30)
-        kw.setdefault("headers", {})
-        kw["headers"].update({"Authorization": f"Bearer {self.access_token}"})
-
+    def _req(self, method: str, path: str, *, quiet: bool = False, **kw):
+        """Wrap *requests* with re‑auth on 401 + uniform error handling.
+
+        There is no pre‑flight expiry check: an expired or revoked token is
+        answered with 401, upon which the token is refreshed once and the
+        same prepared request (body included) is replayed. With *quiet*,
+        failures are logged at DEBUG only – for speculative calls whose
+        result may be discarded (the caller logs them if it does use them).
+        """
+        kw.setdefault("timeout", 30)  # Authorization is a session default header
         url = f"{self.BASE_URL}{path}"
 
         try:
-            resp = requests.request(method, url, **kw)
+            resp = self._session.request(method, url, **kw)
+            if resp.status_code == 401:
+                logger.info("Strava rejected the access token – refreshing and retrying once")
+                self._refresh_rejected(resp.request.headers.get("Authorization"))
+                resp.close()  # release its pooled connection before replaying
+                retry = resp.request.copy()
+                retry.headers["Authorization"] = self._session.headers["Authorization"]
+                # Same settings ``Session.request`` would apply (env CA bundle,
+                # proxies, caller's verify/stream/cert/allow_redirects).
+                send_kw = self._session.merge_environment_settings(
+                    retry.url, kw.get("proxies") or {}, kw.get("stream"), kw.get("verify"), kw.get("cert")
+                )
+                send_kw.update(timeout=kw["timeout"], allow_redirects=kw.get("allow_redirects", True))
+                resp = self._session.send(retry, **send_kw)
             resp.raise_for_status()
             return resp
         except requests.RequestException as exc:
-            logger.error("Strava %s %s failed: %s", method, path, exc)
+            logger.log(logging.DEBUG if quiet else logging.ERROR, "Strava %s %s failed: %s", method, path, exc)
             raise
 
+    def _refresh_rejected(self, rejected: Optional[str]) -> None:
+        """Refresh unless another thread already replaced the *rejected* header.
+
+        Page fetches run concurrently, so several threads can hit 401 on the
+        same token; the lock lets exactly one of them refresh (Strava may
+        rotate the refresh token, so concurrent refreshes would race).
+        """
+        with self._auth_lock:
+            if self._session.headers.get("Authorization") == rejected:
+                self._authenticate()
+
     # ---------------------------------------------------------------------
     # Public API – reads
     # ---------------------------------------------------------------------
     def get_logged_in_athlete_activities(self) -> List[Dict[str, Any]]:
         """Fetch **all** activities (paged)."""
-        logger.info("Fetching ALL athlete activities…")
-        out: List[Dict[str, Any]] = []
-        page = 1
-        while True:
-            params = {"page": page, "per_page": 100}
-            resp = self._req("GET", "/athlete/activities", params=params)
-            batch = resp.json()
-            if not batch:
-                break
-            logger.info("Fetched page %d (%d activities)", page, len(batch))
-            out.extend(batch)
-            page += 1
+        out = list(self.iter_logged_in_athlete_activities())
         logger.info("Total activities fetched: %d", len(out))
         return out
 
+    def iter_logged_in_athlete_activities(
+        self, per_page: int = 100, max_workers: int = 8
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield **all** activities, page by page.
+
+        Page 1 is fetched on its own. While pages keep coming back full, the
+        following pages are requested concurrently and kept in flight while
+        the caller consumes the current one. The window ramps up 1, 2, 4 …
+        to at most *max_workers* as full pages keep arriving (doubling after
+        pages 4, 12 and 28). Pages are yielded strictly in order, and the
+        first short page ends the listing – requests beyond it are cancelled
+        or discarded. Against Strava's rate limit that costs no wasted call
+        up to 4 pages, at most one up to 12 pages (1 200 activities), three
+        up to 28, and never more than ``max_workers - 1``.
+        """
+        logger.info("Fetching ALL athlete activities…")
+
+        def fetch(page: int, quiet: bool = True) -> List[Dict[str, Any]]:
+            params = {"page": page, "per_page": per_page}
+            return self._req("GET", "/athlete/activities", quiet=quiet, params=params).json()
+
+        ex = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="strava-page")
+        pending: Deque[Future] = deque()
+        try:
+            page, next_page = 1, 2
+            batch = fetch(page, quiet=False)
+            while batch:
+                logger.info("Fetched page %d (%d activities)", page, len(batch))
+                full = len(batch) >= per_page
+                if full:
+                    window = min(1 << ((page // 4 + 1).bit_length() - 1), max_workers)
+                    while len(pending) < window:  # keep the window topped up
+                        pending.append(ex.submit(fetch, next_page))
+                        next_page += 1
+                yield from batch
+                if not full:
+                    break
+                try:
+                    batch = pending.popleft().result()
+                except requests.RequestException as exc:  # this page is needed – surface it
+                    logger.error("Strava GET /athlete/activities (page %d) failed: %s", page + 1, exc)
+                    raise
+                page += 1
+        finally:
+            # Drop queued speculative pages, but join the ones already running
+            # (at most ``max_workers - 1``) so no worker thread outlives the
+            # listing – e.g. into the GPX parse pool started right after.
+            ex.shutdown(wait=True, cancel_futures=True)
+
     # ---------------------------------------------------------------------
     # Public API – writes (uploads)
     # ---------------------------------------------------------------------
@@ -163,14 +309,9 @@ class StravaClient:
                         json.dumps(job.payload, indent=2, ensure_ascii=False))
             return None
 
-        files = {
-            "file": (
-                job.gpx_path.name,
-                job.gpx_path.read_bytes(),
-                "application/gpx+xml",
-            )
-        }
-        resp = self._req("POST", "/uploads", data=job.payload, files=files)
+        with job.gpx_path.open("rb") as fh:
+            files = {"file": (job.gpx_path.name, fh, "application/gpx+xml")}
+            resp = self._req("POST", "/uploads", data=job.payload, files=files)
         data = resp.json()
         logger.info("Upload accepted — upload_id=%s", data.get("id"))
         return data
@@ -178,17 +319,30 @@ class StravaClient:
     # ---------------------------------------------------------------------
     # Polling helper
     # ---------------------------------------------------------------------
-    def poll_upload(self, upload_id: int, *, interval: int = 5, timeout: int = 180) -> int:
+    def poll_upload(
+        self,
+        upload_id: int,
+        *,
+        interval: float = 0.5,
+        max_interval: float = 8,
+        timeout: int = 180,
+    ) -> int:
         """Poll ``/uploads/{id}`` until it becomes an activity or fails.
 
+        The first probe happens after *interval* seconds; the wait then
+        doubles up to *max_interval*, so quick uploads are noticed early and
+        slow ones cost few requests.
+
         Returns the new **activity_id** once available. Raises
         :class:`StravaUploadError` on error or timeout.
         """
         deadline = time.time() + timeout
         path = f"/uploads/{upload_id}"
+        delay = interval
 
         while time.time() < deadline:
-            time.sleep(interval)
+            time.sleep(min(delay, max(deadline - time.time(), 0)))
+            delay = min(delay * 2, max_interval)
             data = self._req("GET", path).json()
             status = data.get("status")
             if status == "Your activity is ready.":
@@ -0,0 +1,92 @@
+"""The GPX fast paths must agree with the reference DOM parse.
+
+* ``parse_gpx`` (expat state machine) vs ``_parse_root`` on a loaded tree;
+* ``parse_metadata_only`` must accept/reject exactly what ``parse_gpx`` does.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gpx_handler import LET, GPXHandler  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+_BACKENDS = pytest.mark.parametrize(
+    "use_lxml",
+    [False, pytest.param(True, marks=pytest.mark.skipif(LET is None, reason="lxml not installed"))],
+    ids=["etree", "lxml"],
+)
+
+
+@pytest.fixture()
+def handler() -> GPXHandler:
+    return GPXHandler(FIXTURES)
+
+
+@_BACKENDS
+@pytest.mark.parametrize(
+    "name",
+    ["meta_time.gpx", "no_meta_time.gpx", "first_trkpt_no_time.gpx", "multi_trk_seg.gpx"],
+)
+def test_parse_gpx_matches_dom_parse(name: str, use_lxml: bool) -> None:
+    handler = GPXHandler(FIXTURES, use_lxml=use_lxml)
+    path = FIXTURES / name
+    assert handler.parse_gpx(path) == handler._parse_root(handler._load_root(path), path)
+
+
+@_BACKENDS
+def test_parse_gpx_matches_dom_parse_on_large_file(tmp_path: Path, use_lxml: bool) -> None:
+    pt = (
+        '<trkpt lat="52.{0:06d}" lon="4.{0:06d}"><time>2024-06-01T20:{1:02d}:{2:02d}Z</time>'
+        "<extensions><gpxtpx:TrackPointExtension><gpxtpx:hr>130</gpxtpx:hr>"
+        "</gpxtpx:TrackPointExtension></extensions></trkpt>\n"
+    )
+    body = "".join(pt.format(i, (i // 60) % 60, i % 60) for i in range(8000))
+    path = tmp_path / "large.gpx"
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<gpx version="1.1" creator="WOO" xmlns="http://www.topografix.com/GPX/1/1" '
+        'xmlns:gpxtpx="http://www.garmin.com/xmlschemas/TrackPointExtension/v1">\n'
+        f"<trk><trkseg>\n{body}</trkseg></trk></gpx>\n",
+        encoding="utf-8",
+    )
+    assert path.stat().st_size > 1_000_000
+
+    handler = GPXHandler(tmp_path, use_lxml=use_lxml)
+    assert handler.parse_gpx(path) == handler._parse_root(handler._load_root(path), path)
+
+
+@_BACKENDS
+@pytest.mark.parametrize(
+    "name, message",
+    [("last_trkpt_no_time.gpx", "Last <trkpt> missing <time>"), ("metadata_no_trkpt.gpx", "No <trkpt>")],
+)
+def test_parse_gpx_rejects_like_dom_parse(name: str, message: str, use_lxml: bool) -> None:
+    handler = GPXHandler(FIXTURES, use_lxml=use_lxml)
+    path = FIXTURES / name
+    with pytest.raises(ValueError, match=message):
+        handler.parse_gpx(path)
+    with pytest.raises(ValueError, match=message):
+        handler._parse_root(handler._load_root(path), path)
+
+
+def test_untimed_first_trkpt_falls_through_to_next_time(handler: GPXHandler) -> None:
+    path = FIXTURES / "first_trkpt_no_time.gpx"
+    full, header = handler.parse_gpx(path), handler.parse_metadata_only(path)
+    assert header.start_ts_utc == full.start_ts_utc
+    assert header.start_latlng == full.start_latlng
+    assert header.activity_type == full.activity_type
+
+
+def test_empty_track_is_rejected_by_both(handler: GPXHandler) -> None:
+    path = FIXTURES / "metadata_no_trkpt.gpx"
+    with pytest.raises(ValueError, match="No <trkpt>"):
+        handler.parse_gpx(path)
+    with pytest.raises(ValueError, match="No <trkpt>"):
+        handler.parse_metadata_only(path)
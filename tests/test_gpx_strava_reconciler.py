@@ -0,0 +1,69 @@
+"""``GPXStravaReconciler._parse_all``: pool vs serial parity and metadata‑cache upkeep."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gpx_handler import GPXHandler  # noqa: E402
+from gpx_strava_reconciler import GPXStravaReconciler  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class _NoActivities:
+    def iter_logged_in_athlete_activities(self):
+        return iter(())
+
+
+def _norm(result):
+    """Exceptions don't compare equal – compare them by type and message."""
+    return (type(result), str(result)) if isinstance(result, Exception) else result
+
+
+@pytest.fixture()
+def gpx_dir(tmp_path: Path) -> Path:
+    sources = [FIXTURES / "first_trkpt_no_time.gpx", FIXTURES / "metadata_no_trkpt.gpx"]
+    n = GPXStravaReconciler._PARALLEL_MIN_FILES + 2
+    for i in range(n):
+        shutil.copy(sources[i % len(sources)], tmp_path / f"session_{i:02d}.gpx")
+    return tmp_path
+
+
+def test_pool_parse_matches_serial(gpx_dir: Path, monkeypatch, caplog) -> None:
+    handler = GPXHandler(gpx_dir)
+    paths = list(handler)
+    assert len(paths) >= GPXStravaReconciler._PARALLEL_MIN_FILES
+
+    pooled = GPXStravaReconciler(_NoActivities(), handler, meta_cache_path=None)
+    with caplog.at_level(logging.WARNING, logger="gpx_strava_reconciler"):
+        parallel = pooled._parse_all(paths)
+    assert "Parallel GPX parsing unavailable" not in caplog.text  # really went through the pool
+
+    serial_rec = GPXStravaReconciler(_NoActivities(), GPXHandler(gpx_dir), meta_cache_path=None)
+    monkeypatch.setattr(serial_rec, "_PARALLEL_MIN_FILES", len(paths) + 1)
+    serial = serial_rec._parse_all(paths)
+
+    assert [_norm(r) for r in parallel] == [_norm(r) for r in serial]
+    assert any(not isinstance(r, Exception) for r in serial)
+    assert any(isinstance(r, Exception) for r in serial)
+
+
+def test_meta_cache_drops_files_no_longer_listed(gpx_dir: Path, tmp_path_factory) -> None:
+    cache = tmp_path_factory.mktemp("cache") / "gpx_meta.pkl"
+    first = GPXStravaReconciler(_NoActivities(), GPXHandler(gpx_dir), meta_cache_path=cache)
+    first.reconcile()
+    assert str(gpx_dir / "session_00.gpx") in first._load_meta_cache()
+
+    (gpx_dir / "session_00.gpx").unlink()
+    second = GPXStravaReconciler(_NoActivities(), GPXHandler(gpx_dir), meta_cache_path=cache)
+    second.reconcile()
+    cached = second._load_meta_cache()
+    assert str(gpx_dir / "session_00.gpx") not in cached
+    assert str(gpx_dir / "session_02.gpx") in cached
@@ -0,0 +1,124 @@
+"""``StravaClient._req``: refresh‑on‑401 and replay, against a stub transport."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import strava_client  # noqa: E402
+from gpx_strava_reconciler import GpxUploadJob  # noqa: E402
+from strava_client import StravaClient  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class _StubAdapter(BaseAdapter):
+    """Answers ``/oauth/token`` itself; every other request goes to ``api``."""
+
+    def __init__(self, api: Callable[[requests.PreparedRequest], Tuple[int, dict]]) -> None:
+        super().__init__()
+        self.api = api
+        self.calls: List[Tuple[str, str, str | None, bytes | None]] = []
+        self.token_calls = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        path = request.path_url.split("?", 1)[0]
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        with self._lock:
+            self.calls.append((request.method, path, request.headers.get("Authorization"), body))
+        if path == "/oauth/token":
+            with self._lock:
+                self.token_calls += 1
+                n = self.token_calls
+            return self._response(request, 200, {"access_token": f"tok{n}", "refresh_token": "r", "expires_at": 2**31})
+        return self._response(request, *self.api(request))
+
+    @staticmethod
+    def _response(request, status: int, payload: dict) -> requests.Response:
+        content = json.dumps(payload).encode()
+        resp = requests.Response()
+        resp.status_code = status
+        resp.reason = "Unauthorized" if status == 401 else "OK"
+        resp.headers["Content-Type"] = "application/json"
+        resp.raw = io.BytesIO(content)
+        resp._content, resp._content_consumed = content, True
+        resp.request, resp.url = request, request.url
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def _client(monkeypatch, api) -> Tuple[StravaClient, _StubAdapter]:
+    for var in ("STRAVA_CLIENT_ID", "STRAVA_CLIENT_SECRET", "STRAVA_REFRESH_TOKEN"):
+        monkeypatch.setenv(var, "x")
+    stub = _StubAdapter(api)
+    monkeypatch.setattr(strava_client, "HTTPAdapter", lambda **_: stub)  # mounted on client._session
+    client = StravaClient(token_cache_path=None)
+    assert stub.token_calls == 1 and client.access_token == "tok1"
+    return client, stub
+
+
+def test_upload_is_replayed_byte_for_byte_after_401(monkeypatch) -> None:
+    def api(request):
+        return (401, {}) if request.headers["Authorization"] == "Bearer tok1" else (201, {"id": 7})
+
+    client, stub = _client(monkeypatch, api)
+    job = GpxUploadJob(FIXTURES / "meta_time.gpx", {"data_type": "gpx", "name": "Kiteboarding"})
+    assert client.upload_gpx(job) == {"id": 7}
+
+    uploads = [c for c in stub.calls if c[1] == "/api/v3/uploads"]
+    assert [c[2] for c in uploads] == ["Bearer tok1", "Bearer tok2"]
+    assert uploads[0][3] == uploads[1][3]
+    assert (FIXTURES / "meta_time.gpx").read_bytes() in uploads[1][3]
+    assert stub.token_calls == 2
+    assert all(c[2] is None for c in stub.calls if c[1] == "/oauth/token")  # no bearer on refresh
+
+
+def test_concurrent_401s_on_same_token_refresh_once(monkeypatch) -> None:
+    both_rejected = threading.Barrier(2, timeout=5)
+
+    def api(request):
+        if request.headers["Authorization"] == "Bearer tok1":
+            both_rejected.wait()  # both threads hold a 401 for tok1 before either refreshes
+            return 401, {}
+        return 200, []
+
+    client, stub = _client(monkeypatch, api)
+    errors: List[BaseException] = []
+
+    def call() -> None:
+        try:
+            client._req("GET", "/athlete/activities")
+        except BaseException as exc:  # noqa: BLE001 – re‑raised via the assert below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert not errors
+    assert stub.token_calls == 2  # the one at start‑up + exactly one refresh
+    replays = [c for c in stub.calls if c[1] == "/api/v3/athlete/activities" and c[2] == "Bearer tok2"]
+    assert len(replays) == 2
+
+
+def test_401_on_replay_raises_without_second_refresh(monkeypatch) -> None:
+    client, stub = _client(monkeypatch, lambda request: (401, {}))
+    with pytest.raises(requests.HTTPError):
+        client._req("GET", "/athlete/activities")
+    assert stub.token_calls == 2
+    assert len([c for c in stub.calls if c[1] == "/api/v3/athlete/activities"]) == 2